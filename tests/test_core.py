@@ -1,5 +1,6 @@
+import pytest
 from typing import Any
-from typus.core import Terminal, Sequence, Choice, NonTerminal
+from typus.core import Terminal, Sequence, Choice, NonTerminal, Epsilon
 from typus.backends.base import Compiler
 
 
@@ -29,3 +30,31 @@ def test_ast_structure():
     result = tree.accept(visitor)
 
     assert result == "Seq(Term(start),Choice(Term(a)|NonTerm(B)))"
+
+
+def test_leaf_interning():
+    assert Terminal("a") is Terminal("a")
+    assert Terminal("a") is not Terminal("a", is_regex=True)
+    assert Epsilon() is Epsilon()
+
+    # Shared instances can't be changed under other users
+    t = Terminal("q")
+    with pytest.raises(AttributeError):
+        t.value = "z"
+    with pytest.raises(AttributeError):
+        t.is_regex = True
+    assert Terminal("q").value == "q"
+
+
+def test_subclass_flattening():
+    class MySeq(Sequence):
+        __slots__ = ()
+
+    class MyEpsilon(Epsilon):
+        __slots__ = ()
+
+    assert type(MyEpsilon()) is MyEpsilon
+    assert MyEpsilon() is MyEpsilon()
+
+    seq = Sequence(MySeq("a", "b"), "c", MyEpsilon())
+    assert [t.value for t in seq.items] == ["a", "b", "c"]
@@ -1,5 +1,7 @@
+import dataclasses
+import functools
 import pytest
-from typus.domain.core import Domain, VoidType
+from typus.domain.core import Domain, Edge, Node, VoidType
 
 # --- Domain Fixtures ---
 
@@ -102,3 +104,153 @@ def test_query_api_connectivity():
     # Count returns Int. Path DF -> Int exists. Path Int -> DF does NOT exist.
     assert dom.get_paths(DataFrame, int)
     assert not dom.get_paths(int, DataFrame)
+
+
+def test_query_cache_invalidation():
+    dom = Domain()
+    dom.register(DataFrame)
+
+    paths = dom.get_paths(VoidType, DataFrame, max_depth=1)
+    assert [p[0].name for p in paths] == ["DataFrame"]
+
+    # Mutating the returned paths must not affect later queries
+    paths.clear()
+    assert len(dom.get_paths(VoidType, DataFrame, max_depth=1)) == 1
+
+    # Registering new producers invalidates cached results
+    dom.register(read_csv)
+    names = {p[0].name for p in dom.get_paths(VoidType, DataFrame, max_depth=1)}
+    assert names == {"DataFrame", "read_csv"}
+
+
+class Annotated:
+    def __init__(self, size: int) -> None: ...
+
+
+def test_constructor_return_annotation():
+    dom = Domain()
+    dom.register(Annotated)
+
+    (ctor,) = dom.get_producers(Annotated)
+    assert list(ctor.params) == ["size"]
+
+
+class Untyped:
+    def __init__(self): ...
+    def touch(self): ...
+    def size(self) -> int: ...
+
+
+def test_skip_unannotated():
+    dom = Domain()
+    dom.register(Untyped)
+
+    # Constructors are kept even without annotations
+    assert [e.name for e in dom.get_producers(Untyped)] == ["Untyped"]
+    assert [e.name for e in dom.get_methods(Untyped)] == ["size"]
+
+    # Opt into the untyped graph
+    dom = Domain(skip_unannotated=False)
+    dom.register(Untyped)
+    assert {e.name for e in dom.get_methods(Untyped)} == {"size", "touch"}
+
+
+def test_lazy_edge_lists():
+    dom = Domain()
+    dom.register(DataFrame)
+
+    # int only appears as a return type: its lists are created on access
+    int_node = dom.get_node(int)
+    assert int_node.outgoing == []
+    assert int_node.outgoing is int_node.outgoing
+
+    (count,) = [e for e in dom.get_methods(DataFrame) if e.name == "count"]
+    assert count.params == {}
+    assert count.params is count.params
+
+    # Lists and params passed in or assigned are kept as given
+    edges = [count]
+    node = Node(DataFrame, "DataFrame", outgoing=edges)
+    assert node.outgoing is edges
+    assert node.incoming == []
+    node.incoming = edges
+    assert node.incoming is edges
+
+    params = {}
+    edge = Edge("load", dom.void, node, params=params)
+    params["path"] = dom.get_node(str)
+    assert list(edge.params) == ["path"]
+    edge.params = {}
+    assert edge.params == {}
+
+
+def test_edge_dataclass():
+    dom = Domain()
+    dom.register(Untyped)
+    (ctor,) = dom.get_producers(Untyped)
+
+    names = [f.name for f in dataclasses.fields(ctor)]
+    assert names[:3] == ["name", "source", "target"]
+
+    match ctor:
+        case Edge(name, source, target):
+            assert name == "Untyped"
+            assert source is dom.void
+        case _:
+            pytest.fail("Edge should match positionally")
+
+    # Edges are distinct callables even when their fields match
+    assert ctor != Edge(ctor.name, ctor.source, ctor.target, ctor.params)
+
+
+def variadic(
+    pos: int, /, path: str, *rest: int, sep: str = ",", **options: bool
+) -> DataFrame: ...
+
+
+def passthrough(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@passthrough
+def load(path: str, limit: int) -> DataFrame: ...
+
+
+def test_variadic_params_skipped():
+    dom = Domain()
+    dom.register(variadic)
+
+    (edge,) = dom.get_entrypoints()
+
+    assert list(edge.params) == ["path", "sep"]
+
+
+def parse_rows(path: str) -> list[int]: ...
+
+
+def test_generic_alias_lookup():
+    dom = Domain()
+    dom.register(parse_rows)
+
+    # Fresh alias objects (different identity) still resolve to the origin node
+    node = dom.get_node(list)
+    assert dom.get_node(list[int]) is node
+    assert dom.get_node(list[str]) is node
+
+    # Equal aliases share one cache entry
+    size = len(dom._type_to_node)
+    for _ in range(100):
+        dom.get_node(list[int])
+    assert len(dom._type_to_node) == size
+
+
+def test_decorated_params():
+    dom = Domain()
+    dom.register(load)
+
+    (edge,) = dom.get_entrypoints()
+    assert {k: v.py_type for k, v in edge.params.items()} == {"path": str, "limit": int}
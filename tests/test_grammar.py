@@ -1,7 +1,7 @@
 from typing import cast
 import pytest
-from typus import Grammar
-from typus.core import Terminal, Sequence, Choice, NonTerminal
+from typus import Grammar, grammar
+from typus.core import Terminal, Sequence, Choice, NonTerminal, Epsilon
 
 
 def test_grammar_definition():
@@ -25,6 +25,9 @@ def test_lazy_references():
     assert isinstance(ref, NonTerminal)
     assert ref.name == "expr"
 
+    # References are shared per name
+    assert g.expr is ref
+
 
 def test_recursion_structure():
     """
@@ -44,3 +47,97 @@ def test_recursion_structure():
 
     assert isinstance(last_item, NonTerminal)
     assert last_item.name == "list"
+
+
+def test_compile_cache_invalidation():
+    g = Grammar()
+    g.root = Terminal("A")
+
+    first = g.compile("gbnf")
+    assert g.compile("gbnf") is first
+
+    # Options are part of the cache key
+    assert g.compile("regex", max_depth=2) == "A"
+
+    # Any rule change invalidates cached output
+    g.root = Terminal("B")
+    assert g.compile("gbnf") == 'root ::= "B"'
+
+    g["root"] = Terminal("C")
+    assert g.compile("gbnf") == 'root ::= "C"'
+
+    g.extra = Terminal("D")
+    assert 'extra ::= "D"' in g.compile("gbnf")
+
+    del g["extra"]
+    assert g.compile("gbnf") == 'root ::= "C"'
+
+
+def test_compile_unhashable_options():
+    class Options:
+        def __init__(self, opts):
+            self.opts = opts
+
+        def compile(self, grammar):
+            return repr(self.opts)
+
+    g = Grammar()
+    g.root = Terminal("A")
+
+    Grammar.register("options", Options)
+    try:
+        assert g.compile("options", opts=[1]) == "[1]"
+        assert g.compile("options", opts=[2]) == "[2]"
+    finally:
+        del Grammar._backends["options"]
+
+
+def test_cleanup_deep_nesting():
+    g = Grammar()
+    g.empty = Epsilon()
+
+    # Deeper than the recursion limit, with an empty ref at the bottom
+    body = Sequence(g.empty, Terminal("x"))
+    for _ in range(5000):
+        body = Choice(Sequence(Terminal("a"), body), Terminal("b"))
+
+    g.root = body
+    g.cleanup()
+
+    assert "empty" not in g.rules
+    assert "empty" not in g.compile("lark")
+
+
+def test_cleanup_epsilon_chain():
+    g = Grammar()
+    # Each rule is only empty once the rule it references is known to be
+    g.a = Choice(g.b, Epsilon())
+    g.b = Sequence(g.c, g.c)
+    g.c = Epsilon()
+    g.root = Sequence(Terminal("x"), g.a)
+
+    g.cleanup()
+
+    assert set(g.rules) == {"root"}
+    assert g.rules["root"] == Terminal("x")
+
+
+def test_cleanup_symbol_subclasses():
+    class Keyword(Terminal):
+        pass
+
+    class Block(Sequence):
+        pass
+
+    tables = [dict(t) for t in (grammar._CHILDREN, grammar._IS_EPSILON, grammar._PRUNE)]
+
+    g = Grammar()
+    g.empty = Epsilon()
+    g.root = Block(Keyword("if"), g.empty)
+    g.cleanup()
+
+    # Subclasses resolve to their base handlers...
+    assert set(g.rules) == {"root"}
+    assert g.rules["root"] == Terminal("if")
+    # ...without being added to the module-level dispatch tables
+    assert tables == [grammar._CHILDREN, grammar._IS_EPSILON, grammar._PRUNE]
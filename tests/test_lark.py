@@ -1,7 +1,10 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 import pytest
-from typus import Grammar
-from typus.core import Terminal
+from typus import Grammar, LarkCompiler
+from typus.backends import lark as lark_backend
+from typus.core import Terminal, Choice, NonTerminal
 
 # Import Lark inside test (dev dependency only)
 try:
@@ -92,3 +95,80 @@ def test_lark_template_integration():
 
     tree = parser.parse('"age": 42')
     assert tree.data == "start"
+
+
+def test_lark_shared_subtree():
+    """Test that a symbol reused across rules compiles identically everywhere."""
+    g = Grammar()
+    shared = Terminal("x") | "y"
+    g.a = "a " + shared
+    g.b = "b " + shared
+    g.root = g.a | g.b
+
+    lark_grammar = g.compile("lark")
+    assert 'a: "a " ("x" | "y")' in lark_grammar
+    assert 'b: "b " ("x" | "y")' in lark_grammar
+
+    parser = Lark(lark_grammar)
+    parser.parse("a x")
+    parser.parse("b y")
+
+
+def test_lark_concurrent_compiles():
+    """Test that grammars compiled from several threads don't share state."""
+    grammars = []
+    for i in range(8):
+        g = Grammar()
+        for j in range(50):
+            g[f"item{j}"] = Terminal(f"i{i}_{j}") | f"j{i}"
+        g.root = Choice(*(NonTerminal(f"item{j}") for j in range(50)))
+        grammars.append(g)
+
+    expected = [g.compile("lark") for g in grammars]
+
+    def compile_fresh(g):
+        g._compile_cache.clear()
+        return g.compile("lark")
+
+    # Switch threads as often as possible to surface shared state
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(20):
+                assert list(pool.map(compile_fresh, grammars)) == expected
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_lark_deep_nesting():
+    """Test that deeply nested expressions do not hit the recursion limit."""
+    g = Grammar()
+
+    expr = Terminal("x")
+    for _ in range(5000):
+        # Alternate so that construction-time flattening can't collapse the levels
+        expr = ("a" + expr) | "b"
+
+    g.root = expr
+    lark_grammar = g.compile("lark")
+
+    assert lark_grammar.startswith('start: root\nroot: "a" ("a" (')
+
+
+@pytest.mark.skipif(
+    not lark_backend.__file__.endswith(".py"),
+    reason="mypyc-compiled classes cannot be subclassed from Python",
+)
+def test_lark_subclass_overrides():
+    """Test that visit_* overrides in a LarkCompiler subclass are dispatched to."""
+
+    class UpperLark(LarkCompiler):
+        def visit_terminal(self, node: Terminal) -> str:
+            return super().visit_terminal(node).upper()
+
+    g = Grammar()
+    g.root = Terminal("a") + "b"
+
+    assert g.compile(UpperLark()) == 'start: root\nroot: "A" "B"'
+    assert g.compile("lark") == 'start: root\nroot: "a" "b"'
@@ -1,3 +1,4 @@
+import re
 import pytest
 from typing import cast
 from typus import Grammar
@@ -100,3 +101,20 @@ def test_any_delegates_name():
     # Calling it again should crash
     with pytest.raises(ValueError):
         g.any("A", name="my_zeros")
+
+
+def test_repeat_backends():
+    """g.repeat() is inlined and lowered to native repetition."""
+    g = Grammar()
+    g.item = "A"
+    g.root = g.repeat(g.item, sep=", ")
+
+    assert set(g.rules) == {"item", "root"}
+
+    assert 'root ::= item ( ", " item )*' in g.compile("gbnf")
+    assert 'root: item (", " item)*' in g.compile("lark")
+
+    # No recursion, so no max_depth is needed
+    pattern = g.compile("regex")
+    assert re.fullmatch(pattern, "A, A, A")
+    assert not re.fullmatch(pattern, "A, ")
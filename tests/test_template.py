@@ -73,3 +73,15 @@ def test_template_gbnf_output():
     # root ::= "Call: " fn "(" arg ")"
     assert 'root ::= "Call: " fn "(" arg ")"' in output
     assert 'fn ::= "print"' in output
+
+
+def test_template_folds_literals():
+    """Adjacent literal pieces are merged into one Terminal."""
+    g = Grammar()
+    g.arg = g.regex("[0-9]+")
+
+    rule = g.template("{{{name}}}({arg})", name="f")
+
+    assert len(rule.items) == 3
+    assert cast(Terminal, rule.items[0]).value == "{f}("
+    assert cast(Terminal, rule.items[2]).value == ")"
@@ -1,9 +1,7 @@
-from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING, Protocol
-
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from ..core import Terminal, NonTerminal, Sequence, Choice, Symbol, Epsilon
+    from ..core import Terminal, NonTerminal, Sequence, Choice, Symbol, Epsilon, Repeat
     from ..grammar import Grammar
 
 
@@ -17,5 +15,6 @@ class Compiler[T](Protocol):
     def visit_choice(self, node: "Choice") -> T: ...
     def visit_non_terminal(self, node: "NonTerminal") -> T: ...
     def visit_epsilon(self, node: "Epsilon") -> T: ...
+    def visit_repeat(self, node: "Repeat") -> T: ...
     def visit_rule(self, head: "NonTerminal", body: "Symbol") -> T: ...
     def compile(self, grammar: "Grammar") -> T: ...
@@ -1,5 +1,5 @@
 from typing import Dict
-from typus.core import Epsilon, Symbol, Terminal, NonTerminal, Sequence, Choice
+from typus.core import Epsilon, Symbol, Terminal, NonTerminal, Sequence, Choice, Repeat
 from typus.backends.base import Compiler
 from typus.grammar import Grammar
 
@@ -29,6 +29,13 @@ class GBNFCompiler(Compiler[str]):
         inner = " | ".join(opt.accept(self) for opt in node.options)
         return f"( {inner} )"
 
+    def visit_repeat(self, node: Repeat) -> str:
+        inner = node.symbol.accept(self)
+        if node.sep is None:
+            return f"( {inner} )+"
+        # A ( sep A )*
+        return f"{inner} ( {node.sep.accept(self)} {inner} )*"
+
     def visit_non_terminal(self, node: NonTerminal) -> str:
         # GBNF conventionally uses kebab-case
         return node.name.replace("_", "-")
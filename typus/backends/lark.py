@@ -1,72 +1,144 @@
-from typus.core import Symbol, Terminal, NonTerminal, Sequence, Choice, Epsilon
+from typus.core import Symbol, Terminal, NonTerminal, Sequence, Choice, Epsilon, Repeat
 from typus.backends.base import Compiler
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 if TYPE_CHECKING:
     from typus.grammar import Grammar
 
 
+_SLASH_ESCAPE = str.maketrans({"/": r"\/"})
+_QUOTE_ESCAPE = str.maketrans({'"': r"\""})
+
+
+@lru_cache(maxsize=4096)
+def _compile_terminal(value: str, is_regex: bool) -> str:
+    """Escapes a terminal once per distinct (value, is_regex) pair."""
+    if is_regex:
+        return f"/{value.translate(_SLASH_ESCAPE)}/"
+
+    return f'"{value.translate(_QUOTE_ESCAPE)}"'
+
+
+def _children(node: Symbol) -> list[Symbol]:
+    """Direct sub-symbols of a node (empty for leaves)."""
+    # Direct `type(node) is` checks, which type checkers (and mypyc) narrow on
+    if type(node) is Sequence:
+        return node.items
+    if type(node) is Choice:
+        return node.options
+    if type(node) is Repeat:
+        return [node.symbol] if node.sep is None else [node.symbol, node.sep]
+    return []
+
+
 class LarkCompiler(Compiler[str]):
     """
     Compiles a Typus grammar into a Lark grammar string.
     Does not require 'lark' to be installed.
     """
 
+    # Set by compile()
+    grammar: "Grammar"
+
+    # Concrete node type -> visit function, called as `visit(self, node)` to skip
+    # per-node `accept` dispatch. Built once per class (see below the class).
+    _DISPATCH: ClassVar[dict[type, Callable[[Any, Any], str]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Pick up visit_* overrides
+        cls._DISPATCH = _dispatch_table(cls)
+
     def compile(self, grammar: "Grammar") -> str:
         self.grammar = grammar
-        lines = []
-        lines.append(f"start: root")
+        # Memoized visit results keyed by node identity, valid for this compile only
+        self._memo: dict[int, str] = {}
+        # Choices (by identity) that compiled to a bare "A | B" alternation
+        self._alternations: set[int] = set()
+        # Lark rule names are lowercase; computed once per rule name
+        self._names: dict[str, str] = {name: name.lower() for name in grammar.rules}
+        # Output sink: fragments are appended here and joined once at the end
+        self._out: list[str] = ["start: root"]
+        emit = self._out.extend
+        names = self._names
 
         for name, symbol in grammar.rules.items():
-            definition = symbol.accept(self)
-            if not definition:
-                definition = '""'
-            lines.append(f"{name.lower()}: {definition}")
-
-        return "\n".join(lines)
+            definition = self._visit(symbol) or '""'
+            emit(("\n", names[name], ": ", definition))
+
+        return "".join(self._out)
+
+    def _visit(self, node: Symbol) -> str:
+        """
+        Visits a node once per compile, reusing the result for shared subtrees.
+
+        Children are compiled bottom-up with an explicit stack, so by the time a
+        visitor runs all of its children are memoized and nesting depth is not
+        bounded by the Python recursion limit.
+        """
+        memo = self._memo
+        dispatch = self._DISPATCH
+        key = id(node)
+        if key in memo:
+            return memo[key]
+
+        stack = [(node, False)]
+
+        while stack:
+            current, expanded = stack.pop()
+            key = id(current)
+            if key in memo:
+                continue
 
-    def visit_terminal(self, node: Terminal) -> str:
-        if node.is_regex:
-            clean_val = node.value.replace("/", r"\/")
-            return f"/{clean_val}/"
+            children = _children(current)
 
-        clean_val = node.value.replace('"', r"\"")
-        return f'"{clean_val}"'
+            if expanded or not children:
+                visit = dispatch.get(type(current))
+                # Unknown Symbol subclasses fall back to regular double dispatch
+                memo[key] = visit(self, current) if visit else current.accept(self)
+            else:
+                stack.append((current, True))
+                # Epsilon children are never compiled (see visit_choice)
+                stack.extend(
+                    (child, False)
+                    for child in reversed(children)
+                    if type(child) is not Epsilon and id(child) not in memo
+                )
 
-    def visit_sequence(self, node: Sequence) -> str:
-        parts = [child.accept(self) for child in node.items]
-        clean_parts = [p for p in parts if p]
+        return memo[id(node)]
 
-        if not clean_parts:
-            return ""
+    def visit_terminal(self, node: Terminal) -> str:
+        return _compile_terminal(node.value, node.is_regex)
 
+    def visit_sequence(self, node: Sequence) -> str:
         final_parts = []
-        for child, part in zip(node.items, parts):
+        for child in node.items:
+            part = self._visit(child)
             if not part:
                 continue
 
-            # Wrap choices if they contain pipes to preserve precedence
-            if isinstance(child, Choice) and len(child.options) > 1:
-                if "|" in part:
-                    part = f"({part})"
+            # Wrap bare alternations to preserve precedence
+            if id(child) in self._alternations:
+                part = f"({part})"
 
             final_parts.append(part)
 
         return " ".join(final_parts)
 
     def visit_choice(self, node: Choice) -> str:
-        compiled_opts = []
-        has_epsilon = False
+        # Pre-scan: Epsilon options only make the choice optional
+        options = [opt for opt in node.options if opt.__class__ is not Epsilon]
+        has_epsilon = len(options) != len(node.options)
 
-        for child in node.options:
-            if isinstance(child, Epsilon):
-                has_epsilon = True
+        visit = self._visit
+        compiled_opts = []
+        for child in options:
+            res = visit(child)
+            if res:
+                compiled_opts.append(res)
             else:
-                res = child.accept(self)
-                if not res:
-                    has_epsilon = True
-                else:
-                    compiled_opts.append(res)
+                has_epsilon = True
 
         if not compiled_opts:
             # If all options are epsilon, the choice is effectively empty
@@ -84,10 +156,56 @@ class LarkCompiler(Compiler[str]):
                 # Choice(A, B, Epsilon) -> (A | B)?
                 return f"({core})?"
 
+        if len(compiled_opts) > 1:
+            self._alternations.add(id(node))
+
         return core
 
     def visit_epsilon(self, node: Epsilon) -> str:
         return ""
 
+    def visit_repeat(self, node: Repeat) -> str:
+        item = self._group(node.symbol)
+        sep = self._group(node.sep) if node.sep is not None else ""
+
+        if not item:
+            # (sep ε)* -> sep*
+            return f"{sep}*" if sep else ""
+        if not sep:
+            return f"{item}+"
+        # Repeat(A, sep) -> A (sep A)*
+        return f"{item} ({sep} {item})*"
+
+    def _group(self, node: Symbol) -> str:
+        """Compiles `node` as a single operand for a postfix operator."""
+        part = self._visit(node)
+        if not part or type(node) is Terminal:
+            return part
+        if id(node) in self._alternations or " " in part or part[-1] in "?*+":
+            return f"({part})"
+        return part
+
+    def visit_rule(self, head: NonTerminal, body: Symbol) -> str:
+        definition = self._visit(body) or '""'
+        return f"{self.visit_non_terminal(head)}: {definition}"
+
     def visit_non_terminal(self, node: NonTerminal) -> str:
-        return node.name.lower()
+        name = self._names.get(node.name)
+        if name is None:
+            # Reference to a rule that is not defined in this grammar
+            name = self._names[node.name] = node.name.lower()
+        return name
+
+
+def _dispatch_table(cls: type[LarkCompiler]) -> dict[type, Callable[[Any, Any], str]]:
+    return {
+        Terminal: cls.visit_terminal,
+        Sequence: cls.visit_sequence,
+        Choice: cls.visit_choice,
+        NonTerminal: cls.visit_non_terminal,
+        Epsilon: cls.visit_epsilon,
+        Repeat: cls.visit_repeat,
+    }
+
+
+LarkCompiler._DISPATCH = _dispatch_table(LarkCompiler)
@@ -1,7 +1,7 @@
 import re
 from collections import defaultdict
 from typing import TYPE_CHECKING, Dict
-from typus.core import Symbol, Terminal, NonTerminal, Sequence, Choice, Epsilon
+from typus.core import Symbol, Terminal, NonTerminal, Sequence, Choice, Epsilon, Repeat
 from typus.backends.base import Compiler
 
 if TYPE_CHECKING:
@@ -60,6 +60,14 @@ class RegexCompiler(Compiler[str]):
     def visit_epsilon(self, node: Epsilon) -> str:
         return ""
 
+    def visit_repeat(self, node: Repeat) -> str:
+        # Native repetition: no recursion (and no max_depth) needed
+        # Repeat(A) -> (?:A)+ ; Repeat(A, sep) -> (?:A)(?:sepA)*
+        inner = node.symbol.accept(self)
+        if node.sep is None:
+            return f"(?:{inner})+"
+        return f"(?:{inner})(?:{node.sep.accept(self)}{inner})*"
+
     def visit_non_terminal(self, node: NonTerminal) -> str:
         name = node.name
         current_depth = self._depth_stack[name]
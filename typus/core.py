@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Union, List
-
+from typing import TYPE_CHECKING, ClassVar, Union, List
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
     from .backends.base import Compiler
@@ -11,6 +11,8 @@ class Symbol(ABC):
     The atomic unit of a grammar.
     """
 
+    __slots__ = ("__weakref__",)
+
     @abstractmethod
     def accept[T](self, visitor: "Compiler[T]") -> T:
         pass
@@ -38,14 +40,47 @@ class Symbol(ABC):
 
 
 class Terminal(Symbol):
-    """Represents a literal string or a regex pattern."""
+    """
+    Represents a literal string or a regex pattern.
+
+    Terminals are interned: constructing the same (value, is_regex) twice
+    returns the same object while it is alive, so identity-keyed caches in
+    the backends treat repeated literals as one node. Since instances are
+    shared, they are immutable.
+    """
+
+    __slots__ = ("value", "is_regex")
+
+    _interned: ClassVar["WeakValueDictionary[tuple, Terminal]"] = WeakValueDictionary()
+
+    value: str
+    is_regex: bool
+
+    def __new__(cls, value: str, is_regex: bool = False):
+        key = (cls, value, is_regex)
+        instance = cls._interned.get(key)
+        if instance is not None:
+            return instance
 
-    def __init__(self, value: str, is_regex: bool = False):
         if not value:
             raise ValueError("Terminal cannot be empty")
 
-        self.value = value
-        self.is_regex = is_regex
+        instance = super().__new__(cls)
+        object.__setattr__(instance, "value", value)
+        object.__setattr__(instance, "is_regex", is_regex)
+        cls._interned[key] = instance
+        return instance
+
+    def __setattr__(self, name: str, value: object):
+        # Shared by every Terminal("...") with the same value: keep it immutable
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Copies and unpickled terminals go through interning as well
+        return (type(self), (self.value, self.is_regex))
 
     def accept(self, visitor: "Compiler"):
         return visitor.visit_terminal(self)
@@ -65,8 +100,21 @@ class Epsilon(Symbol):
     """
     Represents the Empty String (ε).
     It produces no tokens and effectively disappears in Sequences.
+    Epsilon is a singleton.
     """
 
+    __slots__ = ()
+
+    _instance: ClassVar["Epsilon | None"] = None
+
+    def __new__(cls):
+        # One instance per class, so subclasses don't get the base singleton
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
     def accept[T](self, visitor: "Compiler[T]") -> T:
         return visitor.visit_epsilon(self)
 
@@ -77,19 +125,23 @@ class Epsilon(Symbol):
 class Sequence(Symbol):
     """A sequence of symbols (A + B)."""
 
+    __slots__ = ("items",)
+
     def __init__(self, *items: Union[Symbol, str]):
         self.items: List[Symbol] = []
+        append = self.items.append
 
         for item in items:
             if isinstance(item, Sequence):
+                # FLATTENING: Sequence(Sequence(A, B), C) -> Sequence(A, B, C)
                 self.items.extend(item.items)
             elif isinstance(item, Epsilon):
                 # Optimization: A + Epsilon -> A
                 pass
             elif isinstance(item, str):
-                self.items.append(Terminal(item))
+                append(Terminal(item))
             else:
-                self.items.append(item)
+                append(item)
 
         if not self.items:
             raise ValueError("Empty sequence")
@@ -104,17 +156,20 @@ class Sequence(Symbol):
 class Choice(Symbol):
     """A choice between symbols (A | B)."""
 
+    __slots__ = ("options",)
+
     def __init__(self, *options: Union[Symbol, str]):
         self.options: List[Symbol] = []
+        append = self.options.append
 
         for opt in options:
             if isinstance(opt, Choice):
                 # FLATTENING: Choice(Choice(A, B), C) -> Choice(A, B, C)
                 self.options.extend(opt.options)
             elif isinstance(opt, str):
-                self.options.append(Terminal(opt))
+                append(Terminal(opt))
             else:
-                self.options.append(opt)
+                append(opt)
 
         if not self.options:
             raise ValueError("Empty choice")
@@ -126,9 +181,42 @@ class Choice(Symbol):
         return f"Choice(*{repr(self.options)})"
 
 
+class Repeat(Symbol):
+    """
+    One or more repetitions of a symbol, optionally separated (A (sep A)*).
+
+    Unlike the recursive rule built by `Grammar.some`, backends lower this
+    directly to their native repetition operator.
+    """
+
+    __slots__ = ("symbol", "sep")
+
+    def __init__(
+        self, symbol: Union[Symbol, str], sep: Union[Symbol, str, None] = None
+    ):
+        if isinstance(symbol, str):
+            symbol = Terminal(symbol)
+        if isinstance(sep, str):
+            sep = Terminal(sep)
+        if isinstance(symbol, Epsilon):
+            raise ValueError("Cannot repeat Epsilon")
+
+        self.symbol: Symbol = symbol
+        # An empty separator is the same as none
+        self.sep: Symbol | None = None if isinstance(sep, Epsilon) else sep
+
+    def accept(self, visitor: "Compiler"):
+        return visitor.visit_repeat(self)
+
+    def __repr__(self) -> str:
+        return f"Repeat({self.symbol!r}, sep={self.sep!r})"
+
+
 class NonTerminal(Symbol):
     """A reference to another rule (e.g., 'expr' or 'statement')."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import inspect
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Set, Type, Any, Callable, Optional, get_type_hints
 
 
@@ -22,7 +24,77 @@ class NoReturn:
     pass
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _type_hints(func: Callable) -> Dict[str, Any]:
+    """
+    Memoized `get_type_hints`, shared by all domains.
+    The returned dict is cached and must not be mutated.
+    Failures are not cached, so forward references can resolve later.
+    """
+    return get_type_hints(func)
+
+
+@lru_cache(maxsize=None)
+def _class_callables(cls: type) -> tuple[Callable, ...]:
+    """
+    Public functions/methods of a class, plus its constructor.
+
+    Walks the raw `__dict__` of each class in the MRO instead of using
+    `inspect.getmembers`, which resolves every attribute through getattr.
+    Names resolve as attribute lookup would (first class in the MRO wins),
+    and results are sorted by name like `getmembers`.
+    """
+    seen: Set[str] = set()
+    members = []
+
+    for klass in cls.__mro__:
+        # object only contributes slot wrappers, which are skipped anyway
+        if klass is object:
+            break
+
+        for name, member in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+
+            if name.startswith("_") and name != "__init__":
+                continue
+
+            if isinstance(member, staticmethod):
+                member = member.__func__
+            elif isinstance(member, classmethod):
+                member = member.__get__(None, cls)
+            elif not inspect.isfunction(member):
+                continue
+
+            members.append((name, member))
+
+    members.sort(key=lambda item: item[0])
+    return tuple(member for _, member in members)
+
+
+def _origin(py_type: Type) -> Type:
+    """Unwraps generic aliases (List[int] -> list); plain classes skip the lookup."""
+    if isinstance(py_type, type):
+        return py_type
+    return getattr(py_type, "__origin__", py_type)
+
+
+# (Current, Edge taken, Parent entry, Depth, ids of edges on the path)
+_PathEntry = tuple["Node", Optional["Edge"], Any, int, frozenset[int]]
+
+
+def _unwind_path(entry: _PathEntry) -> List[Edge]:
+    """Materializes a parent-linked path into a start-to-end list of edges."""
+    path = []
+    while entry[1] is not None:
+        path.append(entry[1])
+        entry = entry[2]
+    path.reverse()
+    return path
+
+
+@dataclass(slots=True)
 class Node:
     """
     A Vertex in the Type Graph, representing a Python Type.
@@ -31,15 +103,50 @@ class Node:
     py_type: Type
     name: str
 
-    # Edges starting from this node (Methods)
-    outgoing: List[Edge] = field(default_factory=list)
-
-    # Edges ending at this node (Producers)
-    incoming: List[Edge] = field(default_factory=list)
-
     # State tracking for incremental builds
     scanned: bool = False
 
+    # Edge lists are allocated on first access: many nodes (e.g. return-only
+    # types) never get methods or producers. Read-only walks use the raw slots.
+    _outgoing: Optional[List[Edge]] = field(default=None, init=False)
+    _incoming: Optional[List[Edge]] = field(default=None, init=False)
+
+    def __init__(
+        self,
+        py_type: Type,
+        name: str,
+        outgoing: Optional[List[Edge]] = None,
+        incoming: Optional[List[Edge]] = None,
+        scanned: bool = False,
+    ):
+        self.py_type = py_type
+        self.name = name
+        self._outgoing = outgoing
+        self._incoming = incoming
+        self.scanned = scanned
+
+    @property
+    def outgoing(self) -> List[Edge]:
+        """Edges starting from this node (Methods)."""
+        if self._outgoing is None:
+            self._outgoing = []
+        return self._outgoing
+
+    @outgoing.setter
+    def outgoing(self, edges: List[Edge]):
+        self._outgoing = edges
+
+    @property
+    def incoming(self) -> List[Edge]:
+        """Edges ending at this node (Producers)."""
+        if self._incoming is None:
+            self._incoming = []
+        return self._incoming
+
+    @incoming.setter
+    def incoming(self, edges: List[Edge]):
+        self._incoming = edges
+
     def __hash__(self):
         return hash(self.py_type)
 
@@ -52,22 +159,52 @@ class Node:
         return f"<Node: {self.name}>"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Edge:
     """
     A Directed Edge representing a Callable (Function, Method, Constructor).
     Connects source -> target.
+
+    The __init__ is hand-written: edges are created for every reflected
+    callable, and a None default is cheaper than default_factory.
+    Edges compare by identity.
     """
 
     name: str
     source: Node
     target: Node
 
-    # Arguments required to traverse this edge
-    params: Dict[str, Node] = field(default_factory=dict)
+    # Arguments required to traverse this edge, allocated on first access
+    _params: Optional[Dict[str, Node]] = field(default=None, repr=False)
+
+    def __init__(
+        self,
+        name: str,
+        source: Node,
+        target: Node,
+        params: Optional[Dict[str, Node]] = None,
+    ):
+        self.name = name
+        self.source = source
+        self.target = target
+
+        # Left unallocated until first access when no params are given
+        self._params = params
+
+    @property
+    def params(self) -> Dict[str, Node]:
+        """Arguments required to traverse this edge."""
+        if self._params is None:
+            self._params = {}
+        return self._params
+
+    @params.setter
+    def params(self, params: Dict[str, Node]):
+        self._params = params
 
     def __repr__(self):
-        args = ", ".join(f"{k}: {v.name}" for k, v in self.params.items())
+        params = self._params or {}
+        args = ", ".join(f"{k}: {v.name}" for k, v in params.items())
         return (
             f"<Edge: {self.source.name} --[{self.name}({args})]--> {self.target.name}>"
         )
@@ -78,10 +215,20 @@ class Domain:
     The Graph of Types.
     Manages Nodes (Types) and Edges (Transitions).
     Allows incremental growth via .register().
+
+    Args:
+        skip_unannotated: If True (default), functions and methods without any
+                          type annotation are left out of the graph.
+                          Constructors are always kept.
     """
 
-    def __init__(self):
+    def __init__(self, skip_unannotated: bool = True):
+        self.skip_unannotated = skip_unannotated
         self.nodes: Dict[Type, Node] = {}
+        # Raw (possibly generic) type -> Node, skips unwrapping on repeat lookups.
+        # Keyed by the type itself: equal aliases (e.g. list[int] evaluated
+        # twice) share one entry, so the table only grows with distinct types.
+        self._type_to_node: Dict[Type, Node] = {}
 
         # Initialize the Graph with the Void Node
         self.void = self._get_or_create_node(VoidType)
@@ -90,6 +237,9 @@ class Domain:
         # Primitives we generally don't want to scan recursively
         self.primitives = {int, str, float, bool, list, dict, set}
 
+        # get_paths results by (start, end, max_depth), dropped on register()
+        self._paths_cache: Dict[tuple, List[List[Edge]]] = {}
+
     def register(self, entity: Any, recursive: bool = False) -> Node:
         """
         Ingests a Python object (Class or Function) into the domain.
@@ -98,6 +248,8 @@ class Domain:
             entity: The Class or Function to register.
             recursive: If True, recursively registers types found in signatures.
         """
+        self._paths_cache.clear()
+
         if inspect.isclass(entity):
             return self._register_class(entity, recursive)
         elif callable(entity):
@@ -106,33 +258,38 @@ class Domain:
             raise ValueError(f"Unsupported entity: {entity}")
 
     def _get_or_create_node(self, py_type: Type) -> Node:
-        # Unwrap generic aliases (List[int] -> list)
-        origin = getattr(py_type, "__origin__", py_type)
+        node = self._type_to_node.get(py_type)
+        if node is not None:
+            return node
 
-        if origin in self.nodes:
-            return self.nodes[origin]
+        origin = _origin(py_type)
 
-        name = getattr(origin, "__name__", str(origin))
-        node = Node(py_type=origin, name=name)
-        self.nodes[origin] = node
+        node = self.nodes.get(origin)
+        if node is None:
+            name = getattr(origin, "__name__", str(origin))
+            node = Node(py_type=origin, name=name)
+            self.nodes[origin] = node
+
+        self._type_to_node[py_type] = node
         return node
 
-    def _register_class(self, cls: Type, recursive: bool) -> Node:
+    def _register_class(self, cls: type, recursive: bool) -> Node:
         node = self._get_or_create_node(cls)
 
-        # Avoid re-scanning or scanning primitives
-        if node.scanned or node.py_type in self.primitives:
+        # Avoid re-scanning
+        if node.scanned:
             return node
 
+        # Marked before the primitives check too, so recursive registration
+        # skips primitive params/returns on the flag alone next time
         node.scanned = True
 
-        # 1. Scan Members
-        for name, member in inspect.getmembers(cls):
-            if name.startswith("_") and name != "__init__":
-                continue
+        if node.py_type in self.primitives:
+            return node
 
-            if inspect.isfunction(member) or inspect.ismethod(member):
-                self._analyze_callable(member, owner=node, recursive=recursive)
+        # 1. Scan Members
+        for member in _class_callables(cls):
+            self._analyze_callable(member, owner=node, recursive=recursive)
 
         return node
 
@@ -153,10 +310,13 @@ class Domain:
 
         # 1. Resolve Type Hints
         try:
-            hints = get_type_hints(func)
+            hints = _type_hints(func)
         except Exception:
             return None
 
+        if not hints and self.skip_unannotated and name != "__init__":
+            return None
+
         # 2. Determine Source and Target
         if name == "__init__":
             # Constructor: Void -> Owner
@@ -169,7 +329,7 @@ class Domain:
             # Regular Method/Function
 
             # Infer target or use NoReturn
-            rt = hints.pop("return", NoReturn)
+            rt = hints.get("return", NoReturn)
 
             if rt is None or rt is type(None):
                 target = self.noret
@@ -184,17 +344,32 @@ class Domain:
                 source = self.void
                 edge_name = name
 
-        # 3. Analyze Parameters
-        params: Dict[str, Node] = {}
-        for param_name, param_type in hints.items():
-            param_node = self._get_or_create_node(param_type)
-            params[param_name] = param_node
-
-            # Recursion: If we see a new type in params, register it?
-            # Usually we want to know its structure to generate valid args.
-            if recursive and not param_node.scanned:
+        # 3. Analyze Parameters (each distinct type is resolved once)
+        # Names come from the code object, in signature order, without
+        # positional-only params and *args/**kwargs, which can't be passed
+        # by keyword. Decorated functions are unwrapped to the original code;
+        # if it still doesn't declare the annotated names, use the hints.
+        code = getattr(inspect.unwrap(func), "__code__", None)
+        annotated = hints.keys() - {"return"}
+        if code is not None and annotated <= set(code.co_varnames):
+            names = code.co_varnames[
+                code.co_posonlyargcount : code.co_argcount + code.co_kwonlyargcount
+            ]
+            param_types = {k: hints[k] for k in names if k in hints}
+        else:
+            param_types = {k: v for k, v in hints.items() if k != "return"}
+        node_for = {
+            param_type: self._get_or_create_node(param_type)
+            for param_type in dict.fromkeys(param_types.values())
+        }
+        params: Dict[str, Node] = {k: node_for[v] for k, v in param_types.items()}
+
+        # Recursion: If we see a new type in params, register it?
+        # Usually we want to know its structure to generate valid args.
+        if recursive:
+            for param_node in node_for.values():
                 # We register it, but maybe as a class to populate its methods?
-                if inspect.isclass(param_node.py_type):
+                if not param_node.scanned and inspect.isclass(param_node.py_type):
                     self._register_class(param_node.py_type, recursive)
 
         # Recursion: Register the Return Type if new
@@ -203,7 +378,8 @@ class Domain:
                 self._register_class(target.py_type, recursive)
 
         # 4. Create and Attach Edge
-        edge = Edge(name=edge_name, source=source, target=target, params=params)
+        # Parameterless callables leave the params dict unallocated
+        edge = Edge(name=edge_name, source=source, target=target, params=params or None)
 
         source.outgoing.append(edge)
         target.incoming.append(edge)
@@ -211,8 +387,13 @@ class Domain:
         return edge
 
     def get_node(self, py_type: Type) -> Node:
-        origin = getattr(py_type, "__origin__", py_type)
-        return self.nodes[origin]
+        node = self._type_to_node.get(py_type)
+        if node is not None:
+            return node
+
+        node = self.nodes[_origin(py_type)]
+        self._type_to_node[py_type] = node
+        return node
 
     def get_entrypoints(self) -> List[Edge]:
         """Returns all edges starting from Void (Constructors/Functions)."""
@@ -229,30 +410,70 @@ class Domain:
     def get_paths(self, start: Type, end: Type, max_depth: int = 5) -> List[List[Edge]]:
         """
         Finds all paths from Start Type to End Type within max_depth.
-        Uses BFS.
+
+        Runs bidirectionally: a backward BFS from End (over incoming edges)
+        records how many hops each node is from End, and the forward BFS from
+        Start only follows edges whose target can still reach End in the
+        remaining depth. Results are cached until the next register().
         """
         start_node = self.get_node(start)
         end_node = self.get_node(end)
         if not start_node or not end_node:
             return []
 
+        key = (start_node, end_node, max_depth)
+        if key not in self._paths_cache:
+            self._paths_cache[key] = self._find_paths(start_node, end_node, max_depth)
+
+        # Copies, so callers can't corrupt the cached paths
+        return [list(path) for path in self._paths_cache[key]]
+
+    def _find_paths(
+        self, start_node: Node, end_node: Node, max_depth: int
+    ) -> List[List[Edge]]:
+        # Backward frontier: minimum hops from each node to End
+        distance = {end_node: 0}
+        frontier = [end_node]
+
+        for hops in range(1, max_depth + 1):
+            next_frontier = []
+            for node in frontier:
+                for edge in node._incoming or ():
+                    if edge.source not in distance:
+                        distance[edge.source] = hops
+                        next_frontier.append(edge.source)
+            frontier = next_frontier
+
+        if start_node not in distance:
+            return []
+
         results = []
-        queue = [(start_node, [])]  # (Current, Path)
+        # Paths are parent-linked (Current, Edge, Parent, Depth, EdgeIds) entries,
+        # materialized as lists only when they reach End
+        queue: deque[_PathEntry] = deque([(start_node, None, None, 0, frozenset())])
 
         while queue:
-            current, path = queue.pop(0)
+            entry = queue.popleft()
+            current, _, _, depth, on_path = entry
 
-            if current == end_node and path:
-                results.append(path)
+            if current == end_node and depth:
+                results.append(_unwind_path(entry))
 
-            if len(path) >= max_depth:
+            remaining = max_depth - depth - 1
+            if remaining < 0:
                 continue
 
-            for edge in current.outgoing:
+            for edge in current._outgoing or ():
+                # Prune branches that can no longer meet the backward frontier
+                if distance.get(edge.target, max_depth + 1) > remaining:
+                    continue
+
                 # Simple cycle prevention for this path
-                if edge in path:
+                if id(edge) in on_path:
                     continue
 
-                queue.append((edge.target, path + [edge]))
+                queue.append(
+                    (edge.target, edge, entry, depth + 1, on_path | {id(edge)})
+                )
 
         return results
@@ -100,14 +100,14 @@ class DomainGenerator:
 
         # --- FIX: Only create Chain rule if fluents exist ---
         if fluents:
-            self.grammar.rules[strict_chain_name] = fluent_choice
+            self.grammar[strict_chain_name] = fluent_choice
             strict_chain_ref = self.grammar.any(NonTerminal(strict_chain_name))
         else:
             # If no fluents, chain is Epsilon. Do NOT add to grammar rules.
             strict_chain_ref = Epsilon()
 
         # T ::= Head + StrictChain
-        self.grammar.rules[ref.name] = head_rule + strict_chain_ref
+        self.grammar[ref.name] = head_rule + strict_chain_ref
 
         # 3. Build Open Pipeline Rule (Pipeline_T)
         # Pipeline_T ::= StrictChain + ( Exit_U Pipeline_U | Exit_V Pipeline_V | epsilon )
@@ -134,7 +134,7 @@ class DomainGenerator:
         else:
             pipeline_rule = strict_chain_ref
 
-        self.grammar.rules[pipeline_name] = pipeline_rule
+        self.grammar[pipeline_name] = pipeline_rule
 
     def build(self, *entrypoints: Type) -> Grammar:
         nodes = self.reflector.reflect(*entrypoints)
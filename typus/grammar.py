@@ -1,20 +1,196 @@
+from collections import deque
 from string import Formatter
-from typing import Dict, Union, Optional, Callable
+from typing import Any, ClassVar, Dict, Union, Optional, Callable
 import re
-from typus.core import Symbol, Terminal, NonTerminal, Sequence, Choice, Epsilon
+from typus.core import Symbol, Terminal, NonTerminal, Sequence, Choice, Epsilon, Repeat
 from .backends.base import Compiler
 
 VisitorFactory = Callable[..., Compiler]
 
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
+_REPEATED_UNDERSCORES = re.compile(r"__+")
+# Stateless; its parse() runs the C-level format string scanner
+_FORMATTER = Formatter()
+
+
+# --- Type-tag dispatch for cleanup() ---
+# Each table maps a concrete Symbol class to its handler, so walking a node
+# costs one dict lookup instead of a chain of isinstance checks.
+
+
+def _dispatch[H](
+    table: Dict[type, H], sym: Symbol, resolved: Dict[type, Optional[H]]
+) -> Optional[H]:
+    """
+    Handler for `sym`; subclasses resolve to their nearest registered base.
+
+    Subclass lookups (including misses) are cached in `resolved`, which the
+    caller keeps for a single walk, so the module tables never change.
+    """
+    cls = type(sym)
+    handler = table.get(cls)
+    if handler is not None:
+        return handler
+    if cls not in resolved:
+        resolved[cls] = next(
+            (table[base] for base in cls.__mro__ if base in table), None
+        )
+    return resolved[cls]
+
+
+def _no_children(sym: Any) -> list[Symbol]:
+    return []
+
+
+_CHILDREN: Dict[type, Callable[[Any], list[Symbol]]] = {
+    Sequence: lambda sym: sym.items,
+    Choice: lambda sym: sym.options,
+    Repeat: lambda sym: [sym.symbol] if sym.sep is None else [sym.symbol, sym.sep],
+    Terminal: _no_children,
+    NonTerminal: _no_children,
+    Epsilon: _no_children,
+}
+
+
+def _children(
+    sym: Symbol, resolved: Dict[type, Optional[Callable[[Any], list[Symbol]]]]
+) -> list[Symbol]:
+    """Direct sub-symbols of a node (empty for leaves)."""
+    children = _dispatch(_CHILDREN, sym, resolved)
+    return children(sym) if children else []
+
+
+# (node, results for its children, epsilon rule names) -> result
+Handler = Callable[[Any, list, set[str]], Any]
+
+
+def _all_empty(sym: Any, parts: list[bool], eps_set: set[str]) -> bool:
+    # Sequence/Choice/Repeat is empty if ALL its parts are empty
+    return all(parts)
+
+
+_IS_EPSILON: Dict[type, Handler] = {
+    Sequence: _all_empty,
+    Choice: _all_empty,
+    Repeat: _all_empty,
+    NonTerminal: lambda sym, parts, eps_set: sym.name in eps_set,
+    Terminal: lambda sym, parts, eps_set: False,
+    Epsilon: lambda sym, parts, eps_set: True,
+}
+
+
+def _prune_sequence(sym: Sequence, parts: list[Symbol], eps_set: set[str]) -> Symbol:
+    new_items = [item for item in parts if not isinstance(item, Epsilon)]
+
+    if not new_items:
+        return Epsilon()
+    if len(new_items) == 1:
+        return new_items[0]
+    return Sequence(*new_items)
+
+
+def _prune_choice(sym: Choice, parts: list[Symbol], eps_set: set[str]) -> Symbol:
+    new_opts = []
+    has_epsilon = False
+    for pruned in parts:
+        if isinstance(pruned, Epsilon):
+            has_epsilon = True
+        else:
+            new_opts.append(pruned)
+
+    if not new_opts:
+        return Epsilon()
+
+    if has_epsilon:
+        # Deduplicate explicit Epsilon
+        if not any(isinstance(o, Epsilon) for o in new_opts):
+            new_opts.append(Epsilon())
+
+    if len(new_opts) == 1:
+        return new_opts[0]
+    return Choice(*new_opts)
+
+
+def _prune_repeat(sym: Repeat, parts: list[Symbol], eps_set: set[str]) -> Symbol:
+    symbol = parts[0]
+    sep = parts[1] if len(parts) > 1 else None
+
+    if not isinstance(symbol, Epsilon):
+        return Repeat(symbol, sep)
+    if sep is None or isinstance(sep, Epsilon):
+        return Epsilon()
+    # (ε (sep ε)*) -> sep*
+    return Choice(Repeat(sep), Epsilon())
+
+
+def _keep(sym: Symbol, parts: list[Symbol], eps_set: set[str]) -> Symbol:
+    return sym
+
+
+_PRUNE: Dict[type, Handler] = {
+    Sequence: _prune_sequence,
+    Choice: _prune_choice,
+    Repeat: _prune_repeat,
+    NonTerminal: lambda sym, parts, eps_set: Epsilon() if sym.name in eps_set else sym,
+    Terminal: _keep,
+    Epsilon: _keep,
+}
+
+
+def _fold(
+    sym: Symbol,
+    table: Dict[type, Handler],
+    eps_set: set[str],
+    memo: Dict[int, Any],
+    default: Handler,
+) -> Any:
+    """
+    Post-order walk computing `table[type(node)](node, child_results, eps_set)`.
+
+    Uses an explicit stack (children first), so nesting depth is not bounded
+    by the recursion limit. Results are memoized by node identity in `memo`.
+    """
+    # Subclass handler lookups, kept for this walk only
+    child_handlers: Dict[type, Any] = {}
+    handlers: Dict[type, Optional[Handler]] = {}
+
+    stack = [(sym, False)]
+    while stack:
+        current, expanded = stack.pop()
+        key = id(current)
+        if key in memo:
+            continue
+
+        children = _children(current, child_handlers)
+        if children and not expanded:
+            stack.append((current, True))
+            stack.extend((child, False) for child in children)
+            continue
+
+        handler = _dispatch(table, current, handlers) or default
+        memo[key] = handler(current, [memo[id(c)] for c in children], eps_set)
+
+    return memo[id(sym)]
+
 
 class Grammar:
     """
     The main container for defining rules.
     """
 
-    _backends: Dict[str, VisitorFactory] = {}
+    _backends: ClassVar[Dict[str, VisitorFactory]] = {}
+
+    # Real attributes; any other name assigned on a Grammar defines a rule
+    _RESERVED: ClassVar[frozenset[str]] = frozenset(
+        {"rules", "_backends", "_version", "_compile_cache", "_nt_cache"}
+    )
 
-    def __init__(self):
+    def __init__(self) -> None:
+        # Bumped on every rule change, invalidates compile() output
+        self._version = 0
+        self._compile_cache: Dict[tuple, tuple[int, str]] = {}
+        # One NonTerminal per referenced name (g.expr, templates, some())
+        self._nt_cache: Dict[str, NonTerminal] = {}
         self.rules: Dict[str, Symbol] = {}
 
     @classmethod
@@ -26,31 +202,71 @@ class Grammar:
 
     def __setitem__(self, name: str, rule: Symbol):
         self.rules[name] = rule
+        self._version += 1
+
+    def __delitem__(self, name: str):
+        del self.rules[name]
+        self._version += 1
 
     def __getattr__(self, name: str) -> NonTerminal:
-        return NonTerminal(name)
+        return self._ref(name)
 
     def __setattr__(self, name: str, value: Union[Symbol, str]):
-        if name in ("rules", "_backends"):
-            super().__setattr__(name, value)
+        if name in Grammar._RESERVED:
+            object.__setattr__(self, name, value)
+            if name == "rules":
+                self._version += 1
             return
 
         if isinstance(value, str):
             value = Terminal(value)
 
         self.rules[name] = value
+        self._version += 1
 
     def compile(self, backend: Union[str, Compiler] = "gbnf", **kwargs) -> str:
+        """
+        Compiles the grammar with a named backend or a compiler instance.
+
+        Output of named backends is cached per backend and options, and reused
+        until a rule is added or replaced through the Grammar API. Mutating a
+        Symbol in place does not invalidate the cache. Calls with unhashable
+        options are compiled without caching.
+        """
         if "root" not in self.rules:
             raise RuntimeError("No root symbol defined")
 
+        key = None
+
         if isinstance(backend, str):
             if backend not in self._backends:
                 known = ", ".join(self._backends.keys())
                 raise ValueError(f"Unknown backend: '{backend}'. Available: {known}")
-            backend = self._backends[backend](**kwargs)
+            factory = self._backends[backend]
+
+            key = (backend, factory, tuple(sorted(kwargs.items())))
+            try:
+                cached = self._compile_cache.get(key)
+            except TypeError:
+                # Unhashable options (lists, dicts...): compile uncached
+                key = cached = None
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
+
+            backend = factory(**kwargs)
 
-        return backend.compile(self)
+        output = backend.compile(self)
+
+        if key is not None:
+            self._compile_cache[key] = (self._version, output)
+
+        return output
+
+    def _ref(self, name: str) -> NonTerminal:
+        ref = self._nt_cache.get(name)
+        if ref is None:
+            ref = self._nt_cache[name] = NonTerminal(name)
+        return ref
 
     # --- High-Level Builders ---
 
@@ -66,9 +282,9 @@ class Grammar:
     def _sanitize(self, text: str) -> str:
         """Converts arbitrary text into a valid GBNF-friendly identifier part."""
         # Replace non-alphanumeric chars with underscore
-        clean = re.sub(r"[^a-zA-Z0-9]", "_", text)
+        clean = _NON_ALNUM.sub("_", text)
         # Collapse multiple underscores
-        clean = re.sub(r"__+", "_", clean)
+        clean = _REPEATED_UNDERSCORES.sub("_", clean)
         return clean.strip("_")
 
     def _get_name(self, symbol: Symbol) -> str:
@@ -120,16 +336,27 @@ class Grammar:
             raise ValueError(f"Rule '{name}' already exists.")
 
         # 3. Define the Recursive Rule
-        ref = NonTerminal(name)
+        ref = self._ref(name)
         if sep:
             # R ::= symbol | symbol + sep + R
-            self.rules[name] = Choice(symbol, symbol + sep + ref)
+            self[name] = Choice(symbol, symbol + sep + ref)
         else:
             # R ::= symbol | symbol + R
-            self.rules[name] = Choice(symbol, symbol + ref)
+            self[name] = Choice(symbol, symbol + ref)
 
         return ref
 
+    def repeat(
+        self, symbol: Union[Symbol, str], sep: Union[Symbol, str, None] = None
+    ) -> Repeat:
+        """
+        OneOrMore, inline: symbol (sep symbol)*
+
+        Unlike some(), no recursive rule is added to the grammar; backends
+        emit their native repetition operator instead.
+        """
+        return Repeat(symbol, sep)
+
     def any(
         self,
         symbol: Union[Symbol, str],
@@ -155,51 +382,71 @@ class Grammar:
         Interpolated rules are resolved by name in the current grammar,
         but can be overriden using **kwargs.
         """
-        symbols = []
+        symbols: list[Union[Symbol, str]] = []
+
+        def add_literal(text: str):
+            # Constant folding: adjacent literals become a single Terminal
+            # (escaped braces and literal kwargs split the text otherwise)
+            if symbols and isinstance(symbols[-1], str):
+                symbols[-1] += text
+            else:
+                symbols.append(text)
 
         # Iterate over the parsed structure
-        for literal, field_name, spec, conversion in Formatter().parse(fmt):
+        for literal, field_name, spec, conversion in _FORMATTER.parse(fmt):
 
             # 1. Add the static text constraint
             if literal:
-                symbols.append(Terminal(literal))
+                add_literal(literal)
 
             # 2. Add the dynamic grammar rule
             if field_name:
                 # Look up the rule in the passed kwargs or the grammar itself
                 rule = kwargs.get(field_name) or getattr(self, field_name)
-                symbols.append(rule)
+
+                if isinstance(rule, str):
+                    add_literal(rule)
+                elif type(rule) is Terminal and not rule.is_regex:
+                    add_literal(rule.value)
+                else:
+                    symbols.append(rule)
 
         return Sequence(*symbols)
 
-    def cleanup(self):
+    def cleanup(self) -> None:
         """
         Removes rules that are effectively Epsilon and updates references.
         """
         # 1. Identify Epsilon Rules (Fixed Point Iteration)
-        epsilon_rules = set()
+        # A rule only needs rechecking when a rule it references turns out
+        # to be empty, so track who references whom and use a worklist.
+        referrers: Dict[str, set[str]] = {}
+        for name, rule in self.rules.items():
+            for ref in self._references(rule):
+                referrers.setdefault(ref, set()).add(name)
 
-        while True:
-            changed = False
-            for name, rule in self.rules.items():
-                if name in epsilon_rules:
-                    continue
+        epsilon_rules: set[str] = set()
+        pending = deque(self.rules)
 
-                if self._is_symbol_epsilon(rule, epsilon_rules):
-                    epsilon_rules.add(name)
-                    changed = True
+        while pending:
+            name = pending.popleft()
+            if name in epsilon_rules:
+                continue
 
-            if not changed:
-                break
+            if self._is_symbol_epsilon(self.rules[name], epsilon_rules):
+                epsilon_rules.add(name)
+                pending.extend(referrers.get(name, ()))
 
         # 2. Prune Epsilon Rules & Update References
+        # Shared by every rule, so common subtrees are pruned once
+        pruned: Dict[int, Symbol] = {}
         new_rules = {}
         for name, rule in self.rules.items():
             if name in epsilon_rules:
                 continue  # Delete the rule
 
             # Update the rule body (replace Refs to empty rules with Epsilon)
-            new_body = self._prune_symbol(rule, epsilon_rules)
+            new_body = self._prune_symbol(rule, epsilon_rules, pruned)
 
             # If the rule became empty during pruning (e.g. it was Sequence(EmptyRef)), drop it too
             if isinstance(new_body, Epsilon):
@@ -213,65 +460,50 @@ class Grammar:
         if self["root"]:
             self.root = self._prune_symbol(self["root"], epsilon_rules)
 
-    def _is_symbol_epsilon(self, sym: Symbol, eps_set: set[str]) -> bool:
-        if isinstance(sym, Epsilon):
-            return True
-        if isinstance(sym, NonTerminal):
-            return sym.name in eps_set
-
-        if isinstance(sym, Sequence):
-            # Sequence is empty if ALL items are empty
-            return not sym.items or all(
-                self._is_symbol_epsilon(i, eps_set) for i in sym.items
-            )
-
-        if isinstance(sym, Choice):
-            # Choice is empty if ALL options are empty
-            return not sym.options or all(
-                self._is_symbol_epsilon(o, eps_set) for o in sym.options
-            )
-
-        return False
-
-    def _prune_symbol(self, sym: Symbol, eps_set: set[str]) -> Symbol:
-        if isinstance(sym, NonTerminal):
-            if sym.name in eps_set:
-                return Epsilon()
-            return sym
-
-        if isinstance(sym, Sequence):
-            new_items = []
-            for item in sym.items:
-                pruned = self._prune_symbol(item, eps_set)
-                if not isinstance(pruned, Epsilon):
-                    new_items.append(pruned)
-
-            if not new_items:
-                return Epsilon()
-            if len(new_items) == 1:
-                return new_items[0]
-            return Sequence(*new_items)
-
-        if isinstance(sym, Choice):
-            new_opts = []
-            has_epsilon = False
-            for opt in sym.options:
-                pruned = self._prune_symbol(opt, eps_set)
-                if isinstance(pruned, Epsilon):
-                    has_epsilon = True
-                else:
-                    new_opts.append(pruned)
+    def _references(self, sym: Symbol) -> set[str]:
+        """Names of all rules referenced from `sym`."""
+        names = set()
+        seen = set()
+        child_handlers: Dict[type, Any] = {}
+        stack = [sym]
 
-            if not new_opts:
-                return Epsilon()
+        while stack:
+            current = stack.pop()
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
 
-            if has_epsilon:
-                # Deduplicate explicit Epsilon
-                if not any(isinstance(o, Epsilon) for o in new_opts):
-                    new_opts.append(Epsilon())
+            if isinstance(current, NonTerminal):
+                names.add(current.name)
+            else:
+                stack.extend(_children(current, child_handlers))
 
-            if len(new_opts) == 1:
-                return new_opts[0]
-            return Choice(*new_opts)
+        return names
+
+    def _is_symbol_epsilon(
+        self, sym: Symbol, eps_set: set[str], memo: Optional[Dict[int, bool]] = None
+    ) -> bool:
+        """
+        Whether `sym` only derives the empty string, given the rules in `eps_set`.
 
-        return sym
+        Results are memoized by node identity in `memo`, which callers may
+        share across rules while `eps_set` is unchanged.
+        """
+        if memo is None:
+            memo = {}
+        # Unknown leaves derive something
+        return _fold(sym, _IS_EPSILON, eps_set, memo, lambda *_: False)
+
+    def _prune_symbol(
+        self, sym: Symbol, eps_set: set[str], memo: Optional[Dict[int, Symbol]] = None
+    ) -> Symbol:
+        """
+        Replaces references to the rules in `eps_set` with Epsilon and
+        simplifies the Sequences/Choices that contain them.
+
+        `memo` maps node identity to its pruned form, so subtrees shared
+        between rules are rebuilt only once.
+        """
+        if memo is None:
+            memo = {}
+        return _fold(sym, _PRUNE, eps_set, memo, _keep)
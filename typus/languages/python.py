@@ -1,7 +1,23 @@
+from functools import lru_cache
 from typing import Dict, Optional, Type
 from typus.core import Epsilon, Symbol, Terminal, Sequence
 from typus.languages.protocol import Language, RenderContext
 
+# Closes every rendered call
+_CLOSE = Terminal(")")
+_EPSILON = Epsilon()
+
+
+@lru_cache(maxsize=4096)
+def _term(value: str) -> Terminal:
+    """
+    Terminal for call fragments like ".name(" or "arg=".
+
+    Terminals are already interned while alive; this keeps the hot ones
+    alive across grammars and skips the weak-dict lookup on repeat calls.
+    """
+    return Terminal(value)
+
 
 class Python(Language):
     """
@@ -29,28 +45,33 @@ class Python(Language):
         # Build Argument List: "arg=val, arg2=val2"
         arg_seq = self._render_args(ctx, args)
 
+        # Built with a single Sequence call: chaining `+` would allocate
+        # (and copy) an intermediate Sequence per operator.
+
         # Case A: Method call on another object (df.count())
         if origin:
-            return origin + Terminal(f".{name}(") + arg_seq + Terminal(")")
+            return Sequence(origin, _term(f".{name}("), arg_seq, _CLOSE)
 
         # Case B: Constructor or Function (DataFrame(...))
-        return Terminal(f"{name}(") + arg_seq + Terminal(")")
+        return Sequence(_term(f"{name}("), arg_seq, _CLOSE)
 
     def render_tail(self, ctx, name: str, args: Dict[str, Symbol]) -> Symbol:
         # Fluent Chaining: .filter(...)
         arg_seq = self._render_args(ctx, args)
-        return Terminal(f".{name}(") + arg_seq + Terminal(")")
+        return Sequence(_term(f".{name}("), arg_seq, _CLOSE)
 
     def _render_args(self, ctx, args: Dict[str, Symbol]) -> Symbol:
         """Helper to build 'k=v, k2=v2' sequence."""
         if not args:
-            return Epsilon()
+            return _EPSILON
 
+        # The separator is folded into the next keyword (", k2="), so k args
+        # take 2k items instead of 3k - 1
         items = []
-        for i, (arg_name, arg_rule) in enumerate(args.items()):
-            if i > 0:
-                items.append(Terminal(", "))
-            items.append(Terminal(f"{arg_name}="))
+        sep = ""
+        for arg_name, arg_rule in args.items():
+            items.append(_term(f"{sep}{arg_name}="))
             items.append(arg_rule)
+            sep = ", "
 
         return Sequence(*items)